@@ -12,22 +12,45 @@ Features:
 - Multiple log levels
 - UTF-8 encoding
 - Automatic directory creation
+- Non-blocking: records are written by a background thread
 
 License: MIT License
 Copyright (c) 2025 Marc Peters
 """
 
+import atexit
 import logging
 import os
-import argparse
+import queue
 import sys
-from logging.handlers import TimedRotatingFileHandler
-from datetime import datetime
+import threading
+import time
+from typing import Optional, Union
+from logging.handlers import (
+    QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+)
 
+# io_uring support is optional (Linux only, needs the liburing package) and
+# is imported by _import_liburing() the first time it is asked for
+liburing = None
 
-def print_help():
-    """Print comprehensive help documentation for the logging system."""
-    help_text = """
+
+# Size limit used for size-based rotation when max_bytes is not given
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+# Formatters and file handlers shared by loggers with the same settings, and
+# the number of running loggers using each shared file handler, all guarded
+# by _cache_lock
+_FORMATTER_CACHE = {}
+_HANDLER_CACHE = {}
+_handler_users = {}
+_cache_lock = threading.Lock()
+
+# Logger names whose stop_rotating_logger() is already registered with atexit
+_atexit_names = set()
+
+
+_HELP_TEXT = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    ROTATING LOG SYSTEM - DOCUMENTATION                      ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -43,6 +66,7 @@ FEATURES:
     • Multiple log levels
     • UTF-8 encoding
     • Automatic directory creation
+    • Non-blocking: records are written by a background thread
 
 COMMAND LINE USAGE:
     python logging_with_rotation.py [OPTIONS]
@@ -67,6 +91,25 @@ ROTATION TIMING OPTIONS:
     'D'        - Days
     'midnight' - Daily at midnight (default)
     'W0'-'W6'  - Weekly (0=Monday, 1=Tuesday, ..., 6=Sunday)
+    None       - Rotate by size instead (see below)
+
+SIZE-BASED ROTATION:
+    With when=None the file is rotated once it reaches max_bytes
+    (default 5 MiB) and backups are numbered: application.log.1, .2, ...
+
+    logger = create_rotating_logger(when=None, max_bytes=5*1024*1024,
+                                    backup_count=2)
+
+    Time vs. size:
+    • Time-based rotation gives one file per period, which makes it easy
+      to find the logs for a given day or hour, but file sizes vary with
+      traffic and very short periods (e.g. when="S") rotate constantly.
+    • Size-based rotation bounds disk usage to roughly
+      max_bytes * (backup_count + 1) regardless of traffic, but a file may
+      span any time range. It also costs more per record: to check the
+      size, every record is formatted a second time and the file is
+      seeked to its end.
+    • The buffered and use_uring options only apply to time-based rotation.
 
 PROGRAMMATIC USAGE:
 
@@ -101,6 +144,16 @@ PROGRAMMATIC USAGE:
     db_logger.info("Database connection established")
     api_logger.warning("API rate limit approaching")
 
+    Lazy Message Formatting:
+    ────────────────────────
+    # Pass values as arguments instead of using f-strings; the message is
+    # only built when the level is enabled
+    api_logger.debug("Request %s took %.2f ms", request_id, elapsed_ms)
+
+    # Guard values that are expensive to compute
+    if api_logger.isEnabledFor(logging.DEBUG):
+        api_logger.debug("Cache state: %s", cache.dump())
+
 EXAMPLES:
 
     1. Daily Rotation at Midnight:
@@ -119,6 +172,27 @@ EXAMPLES:
            custom_format=custom_fmt
        )
 
+    5. Function Name and Line Number:
+       # Walks the stack for every record, roughly halving throughput
+       logger = create_rotating_logger(include_caller=True)
+
+    6. Buffered Output for High-Frequency Logging:
+       # Write in 64 KiB blocks, flush at least once per second
+       logger = create_rotating_logger(
+           buffered=True,
+           flush_bytes=65536,
+           flush_interval=1.0
+       )
+
+    7. io_uring Writes (Linux, pip install liburing):
+       # Bursts of records are submitted to the kernel in batches; falls
+       # back to the regular handler when io_uring is not available
+       logger = create_rotating_logger(when="H", use_uring=True)
+
+       # Sustained bursts: a kernel thread picks up submissions, no syscall
+       logger = create_rotating_logger(when="H", use_uring=True,
+                                       uring_sqpoll=True)
+
 FILE NAMING:
     Rotated files are automatically named with timestamps:
     application.log.2025-07-15_23-59-59
@@ -132,18 +206,19 @@ DIRECTORY STRUCTURE:
     └── ...
 
 API REFERENCE:
-    create_rotating_logger(name, log_file, log_dir, level, when, interval, 
-                          backup_count, console_output, custom_format)
+    create_rotating_logger(name, log_file, log_dir, level, when, max_bytes,
+                           interval, backup_count, console_output,
+                           custom_format, buffered, flush_bytes,
+                           flush_interval, include_caller, use_uring,
+                           uring_sqpoll, propagate)
     get_existing_logger(name)
+    stop_rotating_logger(name)
 
 For more information, run with --show-examples or --demo
 """
-    print(help_text)
 
 
-def show_examples():
-    """Show detailed usage examples."""
-    examples = """
+_EXAMPLES_TEXT = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                              USAGE EXAMPLES                                 ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -227,7 +302,8 @@ try:
     # Some risky operation
     result = risky_operation()
 except Exception as e:
-    error_logger.error(f"Operation failed: {str(e)}")
+    # Pass values as arguments: the message is only built if it is logged
+    error_logger.error("Operation failed: %s", e)
 
 EXAMPLE 6: Development vs Production Configuration
 ──────────────────────────────────────────────────
@@ -249,7 +325,27 @@ else:
         console_output=True
     )
 
-EXAMPLE 7: Multiple Log Files for Different Purposes
+# With the default console_output="auto" the console copy is skipped on its
+# own whenever stderr is not a terminal (systemd, Docker, Kubernetes, ...);
+# pass console_output="force" to keep it there
+logger = create_rotating_logger(level=logging.INFO)
+
+EXAMPLE 7: Child Loggers and Propagation
+────────────────────────────────────────
+# Rotating loggers do not pass records on to the root logger, so handlers
+# set up with logging.basicConfig() no longer see them
+api_logger = create_rotating_logger("api", "api.log")
+
+# Child loggers still end up in api.log through "api"
+logging.getLogger("api.v1").info("Handled by the api logger")
+
+# A child with its own file needs its own rotating logger; it stops there
+v2_logger = create_rotating_logger("api.v2", "api_v2.log")
+
+# Opt back in if the root logger's handlers should get the records too
+audit_logger = create_rotating_logger("audit", "audit.log", propagate=True)
+
+EXAMPLE 8: Multiple Log Files for Different Purposes
 ─────────────────────────────────────────────────────
 # Separate loggers for different concerns
 access_logger = create_rotating_logger("access", "access.log", level=logging.INFO)
@@ -261,7 +357,18 @@ access_logger.info("User logged in")
 debug_logger.debug("Processing user preferences")
 error_logger.error("Failed to save user data")
 """
-    print(examples)
+
+
+def print_help():
+    """Print comprehensive help documentation for the logging system."""
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
+
+
+def show_examples():
+    """Show detailed usage examples."""
+    sys.stdout.write(_EXAMPLES_TEXT)
+    sys.stdout.flush()
 
 
 def run_demo():
@@ -308,7 +415,7 @@ def test_rotation():
     print("LOG ROTATION TEST")
     print("="*80)
     
-    import time
+    from datetime import datetime
     
     # Create test logger with very short rotation interval
     test_logger = create_rotating_logger(
@@ -323,53 +430,475 @@ def test_rotation():
     print("Creating test logger with 3-second rotation...")
     print("Generating messages over 15 seconds to demonstrate rotation...")
     
-    for i in range(15):
-        test_logger.info(f"Test message {i+1} - timestamp: {datetime.now()}")
-        print(f"Message {i+1} logged")
-        time.sleep(1)
+    progress = [f"Message {i + 1} logged\n" for i in range(15)]
+    log_info = test_logger.isEnabledFor(logging.INFO)
+    
+    # Sleep until fixed deadlines so the loop's own work does not add drift
+    start = time.monotonic()
+    for i, line in enumerate(progress):
+        if log_info:
+            test_logger.info("Test message %d - timestamp: %s", i + 1, datetime.now())
+        sys.stdout.write(line)
+        time.sleep(max(0.0, start + i + 1 - time.monotonic()))
     
     print("\nRotation test completed!")
     print("Check the 'test_logs' directory to see rotated files.")
 
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Rotating Log System - A comprehensive logging solution with time-based rotation",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python logging_with_rotation.py --help           Show full documentation
-  python logging_with_rotation.py --demo           Run demonstration
-  python logging_with_rotation.py --show-examples  Show usage examples
-  python logging_with_rotation.py --test-rotation  Test rotation functionality
+# Command line options and the functions they run
+_DISPATCH = {
+    '--demo': run_demo,
+    '--show-examples': show_examples,
+    '--test-rotation': test_rotation,
+    '-h': print_help,
+    '--help': print_help,
+}
+
+
+def main():
+    """Main function for command line execution."""
+    for arg in sys.argv[1:]:
+        command = _DISPATCH.get(arg)
+        if command is not None:
+            command()
+            return
+    print_help()
+
+
+def _import_liburing():
+    """Import liburing on first use; returns None where it is unavailable."""
+    global liburing
+    if liburing is None and sys.platform == "linux":
+        try:
+            import liburing as module
+        except ImportError:
+            return None
+        liburing = module
+    return liburing
+
+
+def _unknown_caller(*args, **kwargs):
+    """Stand-in for Logger.findCaller that skips the stack walk."""
+    return "(unknown file)", 0, "(unknown function)", None
+
+
+class _CachingFormatter(logging.Formatter):
+    """
+    Formatter that formats the timestamp at most once per second.
+    
+    datefmt has no sub-second fields here, so every record created in the
+    same second gets the same string; it is cached instead of calling
+    time.strftime() for each record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted) kept in one attribute so readers never see a
+        # second paired with another second's string
+        self._cached_time = (-1, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached = self._cached_time
+        if sec != cached_sec:
+            cached = time.strftime(datefmt, self.converter(sec))
+            self._cached_time = (sec, cached)
+        return cached
+
+
+class _FastTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler with a cheaper per-record path.
+    
+    The rollover check compares the record's creation time with rolloverAt
+    instead of reading the clock for every record, and emit() does in one
+    method what the base classes spread over three.
+    """
+    
+    def shouldRollover(self, record):
+        if record.created < self.rolloverAt:
+            return False
+        return super().shouldRollover(record)
+    
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
-For complete documentation, use --help
+class _BufferedTimedRotatingFileHandler(_FastTimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler that does not flush after every record.
+    
+    The file is opened with a write buffer of flush_bytes, so many records
+    are written with a single system call. The buffer is written when it is
+    full, on rollover and close, and every flush_interval seconds by a
+    background thread so the file never lags far behind.
+    """
+    
+    def __init__(self, *args, flush_bytes=65536, flush_interval=1.0, **kwargs):
+        self.flush_bytes = flush_bytes
+        super().__init__(*args, **kwargs)
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,), daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        # FileHandler.errors only exists on Python 3.9+
+        return open(self.baseFilename, self.mode, buffering=self.flush_bytes,
+                    encoding=self.encoding, errors=getattr(self, "errors", None))
+    
+    def flush(self):
+        # Called by emit() after every record; the periodic flusher and
+        # close() take care of writing the buffer instead
+        pass
+    
+    def _flush_periodically(self, interval):
+        while not self._closing.wait(interval):
+            self.acquire()
+            try:
+                if self.stream:
+                    self.stream.flush()
+            finally:
+                self.release()
+    
+    def close(self):
+        self._closing.set()
+        # Closing the stream writes whatever is still buffered
+        super().close()
+
+
+class LoggingUringEngine:
+    """
+    Appends log data to one file through io_uring on a background thread.
+    
+    The file must be opened with O_APPEND, so other writers to the same file
+    are never overwritten. The worker takes up to max_batch queued writes at
+    a time, prepares one submission entry per write and hands them all to
+    the kernel with a single io_uring_submit() call. The entries are linked
+    (IOSQE_IO_LINK), so the kernel runs them one after another and they are
+    appended in the order they were queued. The file is registered with the
+    ring once and referenced by index.
+    
+    A single small write is slower through io_uring than through write(),
+    so batches of fewer than min_batch writes are written with os.write()
+    instead.
+    
+    When the kernel supports it, max_batch slabs of slab_size bytes are
+    registered with the ring up front. Consecutive writes of a batch are
+    copied into a slab and submitted as one fixed-buffer write, so the
+    kernel does not have to pin the pages of every write again. Writes
+    larger than a slab are submitted from their own memory.
+    
+    With sqpoll=True the ring is created with IORING_SETUP_SQPOLL: a kernel
+    thread polls the submission queue, so submitting needs no system call
+    while it is awake. It keeps a CPU busy until it has been idle for about
+    a second, which only pays off for loggers that write in sustained
+    bursts. If the kernel refuses (older kernels need privileges for it),
+    a normal ring is used.
+    """
+    
+    def __init__(self, fd, entries=64, max_batch=32, min_batch=8, slab_size=65536,
+                 sqpoll=False):
+        self.max_batch = max_batch
+        self.min_batch = min_batch
+        self.slab_size = slab_size
+        self._fd = fd
+        self._ring = liburing.Ring()
+        if sqpoll:
+            try:
+                liburing.io_uring_queue_init(entries, self._ring, liburing.IORING_SETUP_SQPOLL)
+            except OSError:
+                self._ring = liburing.Ring()
+                sqpoll = False
+        if not sqpoll:
+            liburing.io_uring_queue_init(entries, self._ring)
+        try:
+            liburing.io_uring_register_files(self._ring, liburing.FileIndex([fd]))
+            self._slabs = self._register_slabs()
+        except Exception:
+            liburing.io_uring_queue_exit(self._ring)
+            raise
+        self._cqe = liburing.Cqe()
+        self._ops = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def write(self, data):
+        """Queue data to be appended to the file."""
+        self._ops.put(data)
+    
+    def drain(self):
+        """Wait until every queued write has reached the file."""
+        self._ops.join()
+    
+    def set_file(self, fd):
+        """Write to a different file from now on, e.g. after a rollover."""
+        self.drain()
+        self._fd = fd
+        liburing.io_uring_register_files_update(self._ring, liburing.FileIndex([fd]), 0)
+    
+    def close(self):
+        """Write everything still queued and release the ring."""
+        self._ops.put(None)
+        self._thread.join()
+        liburing.io_uring_queue_exit(self._ring)
+    
+    def _run(self):
+        while True:
+            batch = [self._ops.get()]
+            while batch[-1] is not None and len(batch) < self.max_batch:
+                try:
+                    batch.append(self._ops.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is None
+            writes = batch[:-1] if stop else batch
+            try:
+                if len(writes) >= self.min_batch:
+                    self._submit(writes)
+                else:
+                    for data in writes:
+                        self._write(data)
+            except Exception:
+                if logging.raiseExceptions:
+                    import traceback
+                    sys.stderr.write("--- Logging error ---\n")
+                    traceback.print_exc(file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self._ops.task_done()
+            if stop:
+                return
+    
+    def _register_slabs(self):
+        # Writing from part of a registered buffer needs IORING_OP_WRITEV_FIXED
+        # (Linux 6.15); registration may also fail on RLIMIT_MEMLOCK
+        if not hasattr(liburing, "io_uring_prep_writev_fixed"):
+            return None
+        probe = liburing.io_uring_get_probe_ring(self._ring)
+        try:
+            if not liburing.io_uring_opcode_supported(
+                    probe, liburing.io_uring_op.IORING_OP_WRITEV_FIXED):
+                return None
+        finally:
+            liburing.io_uring_free_probe(probe)
+        slabs = [bytearray(self.slab_size) for _ in range(self.max_batch)]
+        try:
+            liburing.io_uring_register_buffers(self._ring, liburing.Iovec(slabs))
+        except OSError:
+            return None
+        return slabs
+    
+    def _pack(self, writes):
         """
-    )
+        Copy writes into the registered slabs.
+        
+        Returns (data, buf_index) runs in write order; buf_index is None for
+        writes that do not fit in a slab. Every slab is free at the start of
+        a batch because the previous batch has fully completed, and a batch
+        never needs more slabs than it has writes.
+        """
+        runs = []
+        slab_index = -1
+        fill = 0
+        for data in writes:
+            size = len(data)
+            if size > self.slab_size:
+                if fill:
+                    runs.append((memoryview(self._slabs[slab_index])[:fill], slab_index))
+                    fill = 0
+                runs.append((data, None))
+                continue
+            if not fill or fill + size > self.slab_size:
+                if fill:
+                    runs.append((memoryview(self._slabs[slab_index])[:fill], slab_index))
+                slab_index += 1
+                fill = 0
+            self._slabs[slab_index][fill:fill + size] = data
+            fill += size
+        if fill:
+            runs.append((memoryview(self._slabs[slab_index])[:fill], slab_index))
+        return runs
     
-    parser.add_argument('--demo', action='store_true',
-                       help='Run demonstration with sample log messages')
-    parser.add_argument('--show-examples', action='store_true',
-                       help='Show detailed usage examples')
-    parser.add_argument('--test-rotation', action='store_true',
-                       help='Test log rotation functionality')
+    def _submit(self, writes):
+        if self._slabs is None:
+            runs = [(data, None) for data in writes]
+        else:
+            runs = self._pack(writes)
+        # The iovecs only point into the slabs and must outlive the writes
+        iovecs = []
+        last = len(runs) - 1
+        for index, (data, buf_index) in enumerate(runs):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            # The offset is ignored for a file opened with O_APPEND
+            if buf_index is None:
+                liburing.io_uring_prep_write(sqe, 0, data, 0)
+            else:
+                iovecs.append(liburing.Iovec([data]))
+                liburing.io_uring_prep_writev_fixed(sqe, 0, iovecs[-1], buf_index, 0)
+            sqe.flags |= liburing.IOSQE_FIXED_FILE
+            if index < last:
+                sqe.flags |= liburing.IOSQE_IO_LINK
+            sqe.user_data = index
+        liburing.io_uring_submit(self._ring)
+        written = [0] * len(runs)
+        for _ in runs:
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            cqe = self._cqe[0]
+            try:
+                written[cqe.user_data] = cqe.res
+            except OSError:
+                # Failed, or cancelled because an earlier write fell short
+                pass
+            finally:
+                liburing.io_uring_cqe_seen(self._ring, cqe)
+        # A short or failed write breaks the chain, so everything after it
+        # was cancelled; finish the rest in order. A persistent error is
+        # raised from there
+        for (data, _), done in zip(runs, written):
+            if done < len(data):
+                self._write(memoryview(data)[done:])
     
-    return parser.parse_args()
+    def _write(self, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
 
 
-def main():
-    """Main function for command line execution."""
-    args = parse_arguments()
-    
-    if args.demo:
-        run_demo()
-    elif args.show_examples:
-        show_examples()
-    elif args.test_rotation:
-        test_rotation()
-    else:
-        print_help()
+class _UringTimedRotatingFileHandler(_FastTimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler that writes through a LoggingUringEngine.
+    
+    The file is opened with O_APPEND like a regular FileHandler, so other
+    handlers and processes may write to it as well. The engine is drained
+    before the file is rotated or closed.
+    """
+    
+    def __init__(self, *args, sqpoll=False, **kwargs):
+        self._engine = None
+        self._sqpoll = sqpoll
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            if self._engine is None:
+                self._engine = LoggingUringEngine(fd, sqpoll=self._sqpoll)
+            else:
+                self._engine.set_file(fd)
+        except Exception:
+            os.close(fd)
+            raise
+        # Only used so the base classes can close the file
+        return os.fdopen(fd, "ab", buffering=0)
+    
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            # FileHandler.errors only exists on Python 3.9+
+            data = msg.encode(self.encoding, getattr(self, "errors", None) or "strict")
+            self._engine.write(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        if self._engine is not None:
+            self._engine.drain()
+    
+    def doRollover(self):
+        self.flush()
+        super().doRollover()
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
+        finally:
+            self.release()
+        super().close()
+
+
+def _create_file_handler(log_path, when, max_bytes, interval, backup_count,
+                         buffered, flush_bytes, flush_interval, use_uring,
+                         uring_sqpoll):
+    """Creates the rotating file handler for create_rotating_logger."""
+    file_handler = None
+    if when is None:
+        file_handler = RotatingFileHandler(
+            filename=log_path,
+            maxBytes=max_bytes or _DEFAULT_MAX_BYTES,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+    elif use_uring and _import_liburing() is not None:
+        try:
+            file_handler = _UringTimedRotatingFileHandler(
+                filename=log_path,
+                when=when,
+                interval=interval,
+                backupCount=backup_count,
+                encoding='utf-8',
+                sqpoll=uring_sqpoll
+            )
+        except OSError:
+            # io_uring is unavailable (old kernel, seccomp, ...)
+            pass
+    
+    if file_handler is None and buffered:
+        file_handler = _BufferedTimedRotatingFileHandler(
+            filename=log_path,
+            when=when,
+            interval=interval,
+            backupCount=backup_count,
+            encoding='utf-8',
+            flush_bytes=flush_bytes,
+            flush_interval=flush_interval
+        )
+    elif file_handler is None:
+        file_handler = _FastTimedRotatingFileHandler(
+            filename=log_path,
+            when=when,
+            interval=interval,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+    
+    # Set suffix for rotated files (timestamp)
+    if when is not None:
+        file_handler.suffix = "%Y-%m-%d_%H-%M-%S"
+    
+    return file_handler
+
+
+def _is_running_with(logger, config):
+    """Tells whether logger is running unchanged with the given settings."""
+    listener = getattr(logger, "_listener", None)
+    if listener is None or getattr(logger, "_rotating_config", None) != config:
+        return False
+    # The caller may have removed our queue handler in the meantime
+    return any(isinstance(handler, QueueHandler) and handler.queue is listener.queue
+               for handler in logger.handlers)
 
 
 def create_rotating_logger(
@@ -377,15 +906,30 @@ def create_rotating_logger(
     log_file: str = "application.log",
     log_dir: str = "logs",
     level: int = logging.INFO,
-    when: str = "midnight",
+    when: Optional[str] = "midnight",
+    max_bytes: int = 0,
     interval: int = 1,
     backup_count: int = 7,
-    console_output: bool = True,
-    custom_format: str = None
+    console_output: Union[bool, str] = "auto",
+    custom_format: str = None,
+    buffered: bool = False,
+    flush_bytes: int = 65536,
+    flush_interval: float = 1.0,
+    include_caller: bool = False,
+    use_uring: bool = False,
+    uring_sqpoll: bool = False,
+    propagate: bool = False
 ) -> logging.Logger:
     """
     Creates a logger with TimeRotatedFileHandler.
     
+    The logger itself only puts records on a queue; a background listener
+    thread formats and writes them. Use stop_rotating_logger() to shut the
+    listener down before the interpreter exits.
+    
+    Calling it again for a running logger with the same arguments returns
+    the logger unchanged; different arguments reconfigure it.
+    
     Args:
         name (str): Name of the logger
         log_file (str): Name of the log file
@@ -398,62 +942,147 @@ def create_rotating_logger(
                    'D' - Days
                    'midnight' - Daily at midnight
                    'W0'-'W6' - Weekly (0=Monday, 6=Sunday)
+                   None - Rotate by size (see max_bytes)
+        max_bytes (int): File size that triggers rotation when when is None
+                   (0 means 5 MiB)
         interval (int): Interval for rotation
         backup_count (int): Number of backup files to keep
-        console_output (bool): Whether to also log to console
+        console_output (bool or str): Whether to also log to console.
+                   "auto" does so only when stderr is a terminal, so
+                   production deployments with redirected stderr do not
+                   format every record twice; "force" or True always does
         custom_format (str): Custom format for log messages
+        buffered (bool): Buffer file output instead of flushing every record
+        flush_bytes (int): Size of the write buffer when buffered
+        flush_interval (float): Seconds between forced flushes when buffered
+        include_caller (bool): Record function name and line number. Finding
+                   the caller walks the stack for every record and roughly
+                   halves throughput, so it is off by default. While it is
+                   off, %(funcName)s and %(lineno)d show "(unknown function)"
+                   and 0, and the stack_info and stacklevel arguments of the
+                   logging calls have no effect
+        use_uring (bool): Write the file through io_uring in batches. Needs
+                   Linux and the liburing package; otherwise the regular
+                   (or buffered) file handler is used
+        uring_sqpoll (bool): With use_uring, let a kernel thread poll for
+                   submissions so writing needs no system call. Costs a busy
+                   CPU during bursts; falls back if the kernel refuses it
+        propagate (bool): Also pass records to the handlers of ancestor
+                   loggers, such as the root logger
     
     Returns:
         logging.Logger: Configured logger
+    
+    Raises:
+        ValueError: If max_bytes, buffered or use_uring is combined with
+                    the wrong kind of rotation, or if flush_bytes is below 2
+                    or flush_interval is not positive
     """
     
+    if when is not None and max_bytes:
+        raise ValueError("max_bytes requires size-based rotation (when=None)")
+    if when is None and buffered:
+        raise ValueError("buffered output requires time-based rotation")
+    if when is None and use_uring:
+        raise ValueError("use_uring requires time-based rotation")
+    if flush_bytes < 2:
+        raise ValueError("flush_bytes must be at least 2")
+    if flush_interval <= 0:
+        raise ValueError("flush_interval must be positive")
+    
     # Create or get existing logger
     logger = logging.getLogger(name)
+    
+    # A logger that is already running with exactly these settings is
+    # returned as is, keeping its open files
+    config = (level, os.path.abspath(os.path.join(log_dir, log_file)), when,
+              max_bytes, interval, backup_count, console_output, custom_format,
+              buffered, flush_bytes, flush_interval, include_caller, use_uring,
+              uring_sqpoll, propagate)
+    if _is_running_with(logger, config):
+        return logger
+    
     logger.setLevel(level)
     
     # Prevent duplicate handlers on multiple calls
+    stop_rotating_logger(name)
     if logger.handlers:
         logger.handlers.clear()
     
     # Create log directory if it doesn't exist
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir, exist_ok=True)
+    from pathlib import Path
+    try:
+        Path(log_dir).mkdir(parents=True)
         print(f"Log directory created: {log_dir}")
+    except FileExistsError:
+        pass
     
     # Full path to log file
     log_path = os.path.join(log_dir, log_file)
     
     # Define format
-    if custom_format is None:
+    if custom_format is not None:
+        log_format = custom_format
+    elif include_caller:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
     else:
-        log_format = custom_format
+        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    formatter = logging.Formatter(log_format, datefmt='%Y-%m-%d %H:%M:%S')
+    # Skip the per-record stack walk unless caller details were asked for,
+    # even if a custom format mentions them
+    if include_caller:
+        logger.__dict__.pop("findCaller", None)
+    else:
+        logger.findCaller = _unknown_caller
     
-    # Create and configure TimeRotatedFileHandler
-    file_handler = TimedRotatingFileHandler(
-        filename=log_path,
-        when=when,
-        interval=interval,
-        backupCount=backup_count,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
+    datefmt = '%Y-%m-%d %H:%M:%S'
     
-    # Set suffix for rotated files (timestamp)
-    file_handler.suffix = "%Y-%m-%d_%H-%M-%S"
+    # Loggers writing the same file with the same settings share one file
+    # handler: one file descriptor, one lock and one rollover check. Its level
+    # is left unset since each logger filters by its own level
+    handler_key = (os.path.abspath(log_path), when, max_bytes, interval,
+                   backup_count, buffered, flush_bytes, flush_interval,
+                   use_uring, uring_sqpoll, log_format)
+    with _cache_lock:
+        formatter = _FORMATTER_CACHE.get((log_format, datefmt))
+        if formatter is None:
+            formatter = _CachingFormatter(log_format, datefmt=datefmt)
+            _FORMATTER_CACHE[(log_format, datefmt)] = formatter
+        file_handler = _HANDLER_CACHE.get(handler_key)
+        if file_handler is None:
+            file_handler = _create_file_handler(
+                log_path, when, max_bytes, interval, backup_count, buffered,
+                flush_bytes, flush_interval, use_uring, uring_sqpoll
+            )
+            file_handler.setFormatter(formatter)
+            _HANDLER_CACHE[handler_key] = file_handler
+        _handler_users[file_handler] = _handler_users.get(file_handler, 0) + 1
     
-    # Add file handler to logger
-    logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # Optional: Console handler for console output
+    if console_output == "auto":
+        console_output = sys.stderr is not None and sys.stderr.isatty()
     if console_output:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # The logger only enqueues records; formatting, writing and rotation
+    # happen on the listener's background thread
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(QueueHandler(log_queue))
+    # The logger has its own output; passing records on to the root
+    # logger's handlers as well would handle every record twice
+    logger.propagate = propagate
+    listener.start()
+    logger._listener = listener
+    logger._rotating_config = config
+    if name not in _atexit_names:
+        atexit.register(stop_rotating_logger, name)
+        _atexit_names.add(name)
     
     return logger
 
@@ -471,5 +1100,45 @@ def get_existing_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def stop_rotating_logger(name: str) -> None:
+    """
+    Stops the background writer of a logger created by create_rotating_logger.
+    
+    Records still waiting in the queue are written and the log files are
+    closed, unless another running logger shares them. Calling it again,
+    or for a logger without a writer, does nothing. It is registered with
+    atexit, so an explicit call is only needed to release the files earlier.
+    
+    Args:
+        name (str): Name of the logger
+    """
+    logger = logging.getLogger(name)
+    listener = getattr(logger, "_listener", None)
+    if listener is None:
+        return
+    logger._listener = None
+    # Detach the queue first so later records are not queued where nothing
+    # reads them anymore
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            logger.removeHandler(handler)
+    listener.stop()
+    for handler in listener.handlers:
+        _release_handler(handler)
+
+
+def _release_handler(handler):
+    """Closes a handler unless another running logger still shares it."""
+    with _cache_lock:
+        users = _handler_users.pop(handler, 1) - 1
+        if users > 0:
+            _handler_users[handler] = users
+            return
+        for key, cached in list(_HANDLER_CACHE.items()):
+            if cached is handler:
+                del _HANDLER_CACHE[key]
+        handler.close()
+
+
 if __name__ == "__main__":
     main()